@@ -19,6 +19,7 @@
 import numpy as np
 cimport numpy as np
 from cython.parallel import prange
+from cython.parallel import parallel
 
 from gprMax.constants cimport floattype_t
 from gprMax.constants cimport complextype_t
@@ -88,23 +89,26 @@ cpdef void update_electric(
                     Ey[i, j, k] = updatecoeffsE[materialEy, 0] * Ey[i, j, k] + updatecoeffsE[materialEy, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[materialEy, 1] * (Hz[i, j, k] - Hz[i - 1, j, k])
                     Ez[i, j, k] = updatecoeffsE[materialEz, 0] * Ez[i, j, k] + updatecoeffsE[materialEz, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[materialEz, 2] * (Hx[i, j, k] - Hx[i, j - 1, k])
 
-        # Ex components at i = 0
-        for j in prange(1, ny, nogil=True, schedule='static', num_threads=nthreads):
-            for k in range(1, nz):
-                materialEx = ID[0, 0, j, k]
-                Ex[0, j, k] = updatecoeffsE[materialEx, 0] * Ex[0, j, k] + updatecoeffsE[materialEx, 2] * (Hz[0, j, k] - Hz[0, j - 1, k]) - updatecoeffsE[materialEx, 3] * (Hy[0, j, k] - Hy[0, j, k - 1])
+        # Components on the i = 0, j = 0, and k = 0 faces - updated in a single
+        # parallel region to avoid starting a thread team for each face
+        with nogil, parallel(num_threads=nthreads):
+            # Ex components at i = 0
+            for j in prange(1, ny, schedule='static'):
+                for k in range(1, nz):
+                    materialEx = ID[0, 0, j, k]
+                    Ex[0, j, k] = updatecoeffsE[materialEx, 0] * Ex[0, j, k] + updatecoeffsE[materialEx, 2] * (Hz[0, j, k] - Hz[0, j - 1, k]) - updatecoeffsE[materialEx, 3] * (Hy[0, j, k] - Hy[0, j, k - 1])
 
-        # Ey components at j = 0
-        for i in prange(1, nx, nogil=True, schedule='static', num_threads=nthreads):
-            for k in range(1, nz):
-                materialEy = ID[1, i, 0, k]
-                Ey[i, 0, k] = updatecoeffsE[materialEy, 0] * Ey[i, 0, k] + updatecoeffsE[materialEy, 3] * (Hx[i, 0, k] - Hx[i, 0, k - 1]) - updatecoeffsE[materialEy, 1] * (Hz[i, 0, k] - Hz[i - 1, 0, k])
+            # Ey components at j = 0
+            for i in prange(1, nx, schedule='static'):
+                for k in range(1, nz):
+                    materialEy = ID[1, i, 0, k]
+                    Ey[i, 0, k] = updatecoeffsE[materialEy, 0] * Ey[i, 0, k] + updatecoeffsE[materialEy, 3] * (Hx[i, 0, k] - Hx[i, 0, k - 1]) - updatecoeffsE[materialEy, 1] * (Hz[i, 0, k] - Hz[i - 1, 0, k])
 
-        # Ez components at k = 0
-        for i in prange(1, nx, nogil=True, schedule='static', num_threads=nthreads):
-            for j in range(1, ny):
-                materialEz = ID[2, i, j, 0]
-                Ez[i, j, 0] = updatecoeffsE[materialEz, 0] * Ez[i, j, 0] + updatecoeffsE[materialEz, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[materialEz, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0])
+            # Ez components at k = 0
+            for i in prange(1, nx, schedule='static'):
+                for j in range(1, ny):
+                    materialEz = ID[2, i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[materialEz, 0] * Ez[i, j, 0] + updatecoeffsE[materialEz, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[materialEz, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0])
 
 
 #################################################
@@ -74,7 +74,8 @@ class FractalSurface(object):
         elif self.zs == self.zf:
             surfacedims = (self.nx, self.ny)
 
-        self.fractalsurface = np.zeros(surfacedims, dtype=np.complex128)
+        # Every element is written by generate_fractal2D so no need to initialise
+        self.fractalsurface = np.empty(surfacedims, dtype=np.complex128)
 
         # Positional vector at centre of array, scaled by weighting
         v1 = np.array([self.weighting[0] * (surfacedims[0]) / 2, self.weighting[1] * (surfacedims[1]) / 2])
@@ -137,6 +138,8 @@ class FractalVolume(object):
         self.weighting = np.array([1, 1, 1], dtype=np.float64)
         self.nbins = 0
         self.fractalsurfaces = []
+        # IDs of surfaces (e.g. 'xminus') already used by fractal surfaces
+        self.fractalsurfaceIDs = set()
 
     def generate_fractal_volume(self, G):
         """Generate a 3D volume with a fractal distribution.
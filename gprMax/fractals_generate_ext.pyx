@@ -19,6 +19,7 @@
 import numpy as np
 cimport numpy as np
 from cython.parallel import prange
+from libc.math cimport sqrt
 
 
 cpdef void generate_fractal2D(int nx, int ny, int nthreads, int b, np.float64_t[:] weighting, np.float64_t[:] v1, np.complex128_t[:, ::1] A, np.complex128_t[:, ::1] fractalsurface):
@@ -35,16 +36,22 @@ cpdef void generate_fractal2D(int nx, int ny, int nthreads, int b, np.float64_t[
     """
 
     cdef Py_ssize_t i, j
-    cdef double v2x, v2y, rr, B
+    cdef double v1x, v1y, w0, w1, rx2, ry, rr, B
+
+    v1x = v1[0]
+    v1y = v1[1]
+    w0 = weighting[0]
+    w1 = weighting[1]
 
     for i in prange(nx, nogil=True, schedule='static', num_threads=nthreads):
+        # Squared x component of v2 - v1 is constant along each row
+        rx2 = (w0 * i - v1x)**2
         for j in range(ny):
-                # Positional vector for current position
-                v2x = weighting[0] * i
-                v2y = weighting[1] * j
+                # y component of v2 - v1 for current position
+                ry = w1 * j - v1y
 
                 # Calulate norm of v2 - v1
-                rr = ((v2x - v1[0])**2 + (v2y - v1[1])**2)**(1/2)
+                rr = sqrt(rx2 + ry * ry)
 
                 B = rr**b
                 if B == 0:
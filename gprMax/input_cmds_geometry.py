@@ -65,6 +65,21 @@ def process_geometrycmds(geometry, G):
     else:
         progressbars = not G.progressbars
 
+    # Group any modifiers of fractal boxes (rough surfaces, surface water, and
+    # grass) by the ID of the fractal box they operate on, so each fractal box
+    # can look up its modifiers directly rather than searching all commands.
+    # Modifiers with an invalid number of parameters are checked for every
+    # fractal box, where they will raise an error.
+    fractalboxmodifiers = {}
+    fractalboxmodifierslengths = {'#add_surface_roughness:': (13, 14), '#add_surface_water:': (9,), '#add_grass:': (12, 13)}
+    for object in geometry:
+        tmp = object.split()
+        if tmp[0] in fractalboxmodifierslengths:
+            lengths = fractalboxmodifierslengths[tmp[0]]
+            # ID of fractal box is the last of the required parameters
+            fractalboxID = tmp[lengths[0] - 1] if len(tmp) in lengths else None
+            fractalboxmodifiers.setdefault(fractalboxID, []).append(tmp)
+
     for object in tqdm(geometry, desc='Processing geometry related cmds', unit='cmds', ncols=get_terminal_width() - 1, file=sys.stdout, disable=progressbars):
         tmp = object.split()
 
@@ -888,10 +903,8 @@ def process_geometrycmds(geometry, G):
 
             G.fractalvolumes.append(volume)
 
-            # Search and process any modifiers for the fractal box
-            for object in geometry:
-                tmp = object.split()
-
+            # Process any modifiers for the fractal box
+            for tmp in fractalboxmodifiers.get(None, []) + fractalboxmodifiers.get(volume.ID, []):
                 if tmp[0] == '#add_surface_roughness:':
                     if len(tmp) < 13:
                         raise CmdInputError("'" + ' '.join(tmp) + "'" + ' requires at least twelve parameters')
@@ -904,106 +917,80 @@ def process_geometrycmds(geometry, G):
 
                     # Only process rough surfaces for this fractal volume
                     if tmp[12] == volume.ID:
-                        xs = round_value(float(tmp[1]) / G.dx)
-                        xf = round_value(float(tmp[4]) / G.dx)
-                        ys = round_value(float(tmp[2]) / G.dy)
-                        yf = round_value(float(tmp[5]) / G.dy)
-                        zs = round_value(float(tmp[3]) / G.dz)
-                        zf = round_value(float(tmp[6]) / G.dz)
+                        dx, dy, dz = G.dx, G.dy, G.dz
+                        xs = round_value(float(tmp[1]) / dx)
+                        xf = round_value(float(tmp[4]) / dx)
+                        ys = round_value(float(tmp[2]) / dy)
+                        yf = round_value(float(tmp[5]) / dy)
+                        zs = round_value(float(tmp[3]) / dz)
+                        zf = round_value(float(tmp[6]) / dz)
+                        dimension = float(tmp[7])
+                        weighting = np.array([float(tmp[8]), float(tmp[9])])
+                        limits = (float(tmp[10]), float(tmp[11]))
 
                         if xs < 0 or xs > G.nx:
-                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the lower x-coordinate {:g}m is not within the model domain'.format(xs * G.dx))
+                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the lower x-coordinate {:g}m is not within the model domain'.format(xs * dx))
                         if xf < 0 or xf > G.nx:
-                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the upper x-coordinate {:g}m is not within the model domain'.format(xf * G.dx))
+                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the upper x-coordinate {:g}m is not within the model domain'.format(xf * dx))
                         if ys < 0 or ys > G.ny:
-                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the lower y-coordinate {:g}m is not within the model domain'.format(ys * G.dy))
+                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the lower y-coordinate {:g}m is not within the model domain'.format(ys * dy))
                         if yf < 0 or yf > G.ny:
-                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the upper y-coordinate {:g}m is not within the model domain'.format(yf * G.dy))
+                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the upper y-coordinate {:g}m is not within the model domain'.format(yf * dy))
                         if zs < 0 or zs > G.nz:
-                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the lower z-coordinate {:g}m is not within the model domain'.format(zs * G.dz))
+                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the lower z-coordinate {:g}m is not within the model domain'.format(zs * dz))
                         if zf < 0 or zf > G.nz:
-                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the upper z-coordinate {:g}m is not within the model domain'.format(zf * G.dz))
+                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the upper z-coordinate {:g}m is not within the model domain'.format(zf * dz))
                         if xs > xf or ys > yf or zs > zf:
                             raise CmdInputError("'" + ' '.join(tmp) + "'" + ' the lower coordinates should be less than the upper coordinates')
-                        if float(tmp[7]) < 0:
+                        if dimension < 0:
                             raise CmdInputError("'" + ' '.join(tmp) + "'" + ' requires a positive value for the fractal dimension')
-                        if float(tmp[8]) < 0:
+                        if weighting[0] < 0:
                             raise CmdInputError("'" + ' '.join(tmp) + "'" + ' requires a positive value for the fractal weighting in the first direction of the surface')
-                        if float(tmp[9]) < 0:
+                        if weighting[1] < 0:
                             raise CmdInputError("'" + ' '.join(tmp) + "'" + ' requires a positive value for the fractal weighting in the second direction of the surface')
 
-                        # Check for valid orientations
-                        if xs == xf:
-                            if ys == yf or zs == zf:
-                                raise CmdInputError("'" + ' '.join(tmp) + "'" + ' dimensions are not specified correctly')
-                            if xs != volume.xs and xs != volume.xf:
-                                raise CmdInputError("'" + ' '.join(tmp) + "'" + ' can only be used on the external surfaces of a fractal box')
-                            fractalrange = (round_value(float(tmp[10]) / G.dx), round_value(float(tmp[11]) / G.dx))
-                            # xminus surface
-                            if xs == volume.xs:
-                                if fractalrange[0] < 0 or fractalrange[1] > volume.xf:
-                                    raise CmdInputError("'" + ' '.join(tmp) + "'" + ' cannot apply fractal surface to fractal box as it would exceed either the upper coordinates of the fractal box or the domain in the x direction')
-                                requestedsurface = 'xminus'
-                            # xplus surface
-                            elif xf == volume.xf:
-                                if fractalrange[0] < volume.xs or fractalrange[1] > G.nx:
-                                    raise CmdInputError("'" + ' '.join(tmp) + "'" + ' cannot apply fractal surface to fractal box as it would exceed either the lower coordinates of the fractal box or the domain in the x direction')
-                                requestedsurface = 'xplus'
-
-                        elif ys == yf:
-                            if xs == xf or zs == zf:
-                                raise CmdInputError("'" + ' '.join(tmp) + "'" + ' dimensions are not specified correctly')
-                            if ys != volume.ys and ys != volume.yf:
-                                raise CmdInputError("'" + ' '.join(tmp) + "'" + ' can only be used on the external surfaces of a fractal box')
-                            fractalrange = (round_value(float(tmp[10]) / G.dy), round_value(float(tmp[11]) / G.dy))
-                            # yminus surface
-                            if ys == volume.ys:
-                                if fractalrange[0] < 0 or fractalrange[1] > volume.yf:
-                                    raise CmdInputError("'" + ' '.join(tmp) + "'" + ' cannot apply fractal surface to fractal box as it would exceed either the upper coordinates of the fractal box or the domain in the y direction')
-                                requestedsurface = 'yminus'
-                            # yplus surface
-                            elif yf == volume.yf:
-                                if fractalrange[0] < volume.ys or fractalrange[1] > G.ny:
-                                    raise CmdInputError("'" + ' '.join(tmp) + "'" + ' cannot apply fractal surface to fractal box as it would exceed either the lower coordinates of the fractal box or the domain in the y direction')
-                                requestedsurface = 'yplus'
-
-                        elif zs == zf:
-                            if xs == xf or ys == yf:
-                                raise CmdInputError("'" + ' '.join(tmp) + "'" + ' dimensions are not specified correctly')
-                            if zs != volume.zs and zs != volume.zf:
-                                raise CmdInputError("'" + ' '.join(tmp) + "'" + ' can only be used on the external surfaces of a fractal box')
-                            fractalrange = (round_value(float(tmp[10]) / G.dz), round_value(float(tmp[11]) / G.dz))
-                            # zminus surface
-                            if zs == volume.zs:
-                                if fractalrange[0] < 0 or fractalrange[1] > volume.zf:
-                                    raise CmdInputError("'" + ' '.join(tmp) + "'" + ' cannot apply fractal surface to fractal box as it would exceed either the upper coordinates of the fractal box or the domain in the x direction')
-                                requestedsurface = 'zminus'
-                            # zplus surface
-                            elif zf == volume.zf:
-                                if fractalrange[0] < volume.zs or fractalrange[1] > G.nz:
-                                    raise CmdInputError("'" + ' '.join(tmp) + "'" + ' cannot apply fractal surface to fractal box as it would exceed either the lower coordinates of the fractal box or the domain in the z direction')
-                                requestedsurface = 'zplus'
-
-                        else:
+                        # Check for valid orientations - surface must be planar
+                        # in exactly one direction
+                        surfacecoords = ((xs, xf), (ys, yf), (zs, zf))
+                        planar = [start == finish for start, finish in surfacecoords]
+                        if planar.count(True) != 1:
                             raise CmdInputError("'" + ' '.join(tmp) + "'" + ' dimensions are not specified correctly')
+                        axis = planar.index(True)
+                        direction = 'xyz'[axis]
+                        dl = (dx, dy, dz)[axis]
+                        n = (G.nx, G.ny, G.nz)[axis]
+                        volumestart, volumefinish = ((volume.xs, volume.xf), (volume.ys, volume.yf), (volume.zs, volume.zf))[axis]
+                        start, finish = surfacecoords[axis]
+                        if start != volumestart and start != volumefinish:
+                            raise CmdInputError("'" + ' '.join(tmp) + "'" + ' can only be used on the external surfaces of a fractal box')
+                        fractalrange = (round_value(limits[0] / dl), round_value(limits[1] / dl))
+                        # xminus, yminus or zminus surface
+                        if start == volumestart:
+                            if fractalrange[0] < 0 or fractalrange[1] > volumefinish:
+                                raise CmdInputError("'" + ' '.join(tmp) + "'" + ' cannot apply fractal surface to fractal box as it would exceed either the upper coordinates of the fractal box or the domain in the {} direction'.format(direction))
+                            requestedsurface = direction + 'minus'
+                        # xplus, yplus or zplus surface
+                        else:
+                            if fractalrange[0] < volumestart or fractalrange[1] > n:
+                                raise CmdInputError("'" + ' '.join(tmp) + "'" + ' cannot apply fractal surface to fractal box as it would exceed either the lower coordinates of the fractal box or the domain in the {} direction'.format(direction))
+                            requestedsurface = direction + 'plus'
 
-                        surface = FractalSurface(xs, xf, ys, yf, zs, zf, float(tmp[7]))
+                        surface = FractalSurface(xs, xf, ys, yf, zs, zf, dimension)
                         surface.surfaceID = requestedsurface
                         surface.fractalrange = fractalrange
                         surface.operatingonID = volume.ID
                         surface.seed = seed
-                        surface.weighting = np.array([float(tmp[8]), float(tmp[9])])
+                        surface.weighting = weighting
 
-                        # List of existing surfaces IDs
-                        existingsurfaceIDs = [x.surfaceID for x in volume.fractalsurfaces]
-                        if surface.surfaceID in existingsurfaceIDs:
+                        if surface.surfaceID in volume.fractalsurfaceIDs:
                             raise CmdInputError("'" + ' '.join(tmp) + "'" + ' has already been used on the {} surface'.format(surface.surfaceID))
 
                         surface.generate_fractal_surface(G)
                         volume.fractalsurfaces.append(surface)
+                        volume.fractalsurfaceIDs.add(surface.surfaceID)
 
                         if G.messages:
-                            tqdm.write('Fractal surface from {:g}m, {:g}m, {:g}m, to {:g}m, {:g}m, {:g}m with fractal dimension {:g}, fractal weightings {:g}, {:g}, fractal seeding {}, and range {:g}m to {:g}m, added to {}.'.format(xs * G.dx, ys * G.dy, zs * G.dz, xf * G.dx, yf * G.dy, zf * G.dz, surface.dimension, surface.weighting[0], surface.weighting[1], surface.seed, float(tmp[10]), float(tmp[11]), surface.operatingonID))
+                            tqdm.write('Fractal surface from {:g}m, {:g}m, {:g}m, to {:g}m, {:g}m, {:g}m with fractal dimension {:g}, fractal weightings {:g}, {:g}, fractal seeding {}, and range {:g}m to {:g}m, added to {}.'.format(xs * dx, ys * dy, zs * dz, xf * dx, yf * dy, zf * dz, surface.dimension, surface.weighting[0], surface.weighting[1], surface.seed, limits[0], limits[1], surface.operatingonID))
 
                 if tmp[0] == '#add_surface_water:':
                     if len(tmp) != 9:
@@ -1221,8 +1208,8 @@ def process_geometrycmds(geometry, G):
                         probability1D = np.cumsum(np.ravel(surface.fractalsurface))
 
                         # Create random numbers between zero and one for the number of blades of grass
-                        R = np.random.RandomState(surface.seed)
-                        A = R.random_sample(numblades)
+                        R = np.random.default_rng(seed=surface.seed)
+                        A = R.random(numblades)
 
                         # Locate the random numbers in the bins created by the 1D vector of probability values, and convert the 1D index back into a x, y index for the original surface.
                         bladesindex = np.unravel_index(np.digitize(A, probability1D), (surface.fractalsurface.shape[0], surface.fractalsurface.shape[1]))
@@ -1233,7 +1220,7 @@ def process_geometrycmds(geometry, G):
                         # Set the fractal surface using the pre-calculated spatial distribution and a random height
                         surface.fractalsurface = np.zeros((surface.fractalsurface.shape[0], surface.fractalsurface.shape[1]))
                         for i in range(len(bladesindex[0])):
-                            surface.fractalsurface[bladesindex[0][i], bladesindex[1][i]] = R.randint(surface.fractalrange[0], surface.fractalrange[1], size=1)
+                            surface.fractalsurface[bladesindex[0][i], bladesindex[1][i]] = R.integers(surface.fractalrange[0], surface.fractalrange[1])
 
                         # Create grass geometry parameters
                         g = Grass(numblades)
@@ -1259,6 +1246,7 @@ def process_geometrycmds(geometry, G):
                             raise CmdInputError("'" + ' '.join(tmp) + "'" + ' requires the time step for the model to be less than the relaxation time required to model grass.')
 
                         volume.fractalsurfaces.append(surface)
+                        volume.fractalsurfaceIDs.add(surface.surfaceID)
 
                         if G.messages:
                             tqdm.write('{} blades of grass on surface from {:g}m, {:g}m, {:g}m, to {:g}m, {:g}m, {:g}m with fractal dimension {:g}, fractal seeding {}, and range {:g}m to {:g}m, added to {}.'.format(numblades, xs * G.dx, ys * G.dy, zs * G.dz, xf * G.dx, yf * G.dy, zf * G.dz, surface.dimension, surface.seed, float(tmp[8]), float(tmp[9]), surface.operatingonID))
@@ -17,6 +17,7 @@
 # along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
 
 import datetime
+from functools import partial
 from importlib import import_module
 import itertools
 import os
@@ -419,55 +420,79 @@ def solve_cpu(currentmodelrun, modelend, G):
         tsolve (float): Time taken to execute solving
     """
 
+    # Bind field update kernels to their (fixed) arguments once, so that each
+    # iteration only dispatches to the compiled Cython (OpenMP) functions
+    fields = (G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz)
+    update_magnetic_fields = partial(update_magnetic, G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsH, G.ID, *fields)
+
+    # All materials are non-dispersive so do standard update
+    if Material.maxpoles == 0:
+        update_electric_fields = partial(update_electric, G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.ID, *fields)
+        update_electric_fields_dispersive = None
+    # If there are any dispersive materials do 1st part of dispersive update
+    # (it is split into two parts as it requires present and updated electric
+    # field values). The 2nd part can only be completely updated after the
+    # electric field has been updated by the PML and source updates.
+    elif Material.maxpoles == 1:
+        update_electric_fields = partial(update_electric_dispersive_1pole_A, G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ty, G.Tz, *fields)
+        update_electric_fields_dispersive = partial(update_electric_dispersive_1pole_B, G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ty, G.Tz, G.Ex, G.Ey, G.Ez)
+    elif Material.maxpoles > 1:
+        update_electric_fields = partial(update_electric_dispersive_multipole_A, G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ty, G.Tz, *fields)
+        update_electric_fields_dispersive = partial(update_electric_dispersive_multipole_B, G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ty, G.Tz, G.Ex, G.Ey, G.Ez)
+
+    # Get PML update functions
+    for pml in G.pmls:
+        pml.get_update_funcs(G)
+
+    # Iterations on which snapshots are stored
+    snapsiterations = {}
+    for snap in G.snapshots:
+        snapsiterations.setdefault(snap.time - 1, []).append(snap)
+
+    # Sources updated on magnetic and electric field components (update any
+    # Hertzian dipole sources last)
+    magneticsources = G.transmissionlines + G.magneticdipoles
+    electricsources = G.voltagesources + G.transmissionlines + G.hertziandipoles
+
+    # PML update functions (with arguments bound)
+    pmlsupdatemagnetic = [pml.update_magnetic_func for pml in G.pmls]
+    pmlsupdateelectric = [pml.update_electric_func for pml in G.pmls]
+
     tsolvestart = timer()
 
     for iteration in tqdm(range(G.iterations), desc='Running simulation, model ' + str(currentmodelrun) + '/' + str(modelend), ncols=get_terminal_width() - 1, file=sys.stdout, disable=not G.progressbars):
         # Store field component values for every receiver and transmission line
-        store_outputs(iteration, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz, G)
+        store_outputs(iteration, *fields, G)
 
         # Store any snapshots
-        for snap in G.snapshots:
-            if snap.time == iteration + 1:
-                snap.store(G)
+        for snap in snapsiterations.get(iteration, ()):
+            snap.store(G)
 
         # Update magnetic field components
-        update_magnetic(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsH, G.ID, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz)
+        update_magnetic_fields()
 
         # Update magnetic field components with the PML correction
-        for pml in G.pmls:
-            pml.update_magnetic(G)
+        for update_pml_magnetic in pmlsupdatemagnetic:
+            update_pml_magnetic()
 
         # Update magnetic field components from sources
-        for source in G.transmissionlines + G.magneticdipoles:
+        for source in magneticsources:
             source.update_magnetic(iteration, G.updatecoeffsH, G.ID, G.Hx, G.Hy, G.Hz, G)
 
-        # Update electric field components
-        # All materials are non-dispersive so do standard update
-        if Material.maxpoles == 0:
-            update_electric(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.ID, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz)
-        # If there are any dispersive materials do 1st part of dispersive update
-        # (it is split into two parts as it requires present and updated electric field values).
-        elif Material.maxpoles == 1:
-            update_electric_dispersive_1pole_A(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ty, G.Tz, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz)
-        elif Material.maxpoles > 1:
-            update_electric_dispersive_multipole_A(G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ty, G.Tz, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz)
+        # Update electric field components (standard or 1st part of dispersive)
+        update_electric_fields()
 
         # Update electric field components with the PML correction
-        for pml in G.pmls:
-            pml.update_electric(G)
+        for update_pml_electric in pmlsupdateelectric:
+            update_pml_electric()
 
-        # Update electric field components from sources (update any Hertzian dipole sources last)
-        for source in G.voltagesources + G.transmissionlines + G.hertziandipoles:
+        # Update electric field components from sources
+        for source in electricsources:
             source.update_electric(iteration, G.updatecoeffsE, G.ID, G.Ex, G.Ey, G.Ez, G)
 
         # If there are any dispersive materials do 2nd part of dispersive update
-        # (it is split into two parts as it requires present and updated electric
-        # field values). Therefore it can only be completely updated after the
-        # electric field has been updated by the PML and source updates.
-        if Material.maxpoles == 1:
-            update_electric_dispersive_1pole_B(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ty, G.Tz, G.Ex, G.Ey, G.Ez)
-        elif Material.maxpoles > 1:
-            update_electric_dispersive_multipole_B(G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ty, G.Tz, G.Ex, G.Ey, G.Ez)
+        if update_electric_fields_dispersive:
+            update_electric_fields_dispersive()
 
     tsolve = timer() - tsolvestart
 
@@ -506,8 +531,10 @@ def solve_gpu(currentmodelrun, modelend, G):
         kernels_fields = SourceModule(kernels_template_fields.substitute(REAL=cudafloattype, COMPLEX=cudacomplextype, N_updatecoeffsE=G.updatecoeffsE.size, N_updatecoeffsH=G.updatecoeffsH.size, NY_MATCOEFFS=G.updatecoeffsE.shape[1], NY_MATDISPCOEFFS=G.updatecoeffsdispersive.shape[1], NX_FIELDS=G.nx + 1, NY_FIELDS=G.ny + 1, NZ_FIELDS=G.nz + 1, NX_ID=G.ID.shape[1], NY_ID=G.ID.shape[2], NZ_ID=G.ID.shape[3], NX_T=G.Tx.shape[1], NY_T=G.Tx.shape[2], NZ_T=G.Tx.shape[3]), options=compiler_opts)
     else:   # Set to one any substitutions for dispersive materials
         kernels_fields = SourceModule(kernels_template_fields.substitute(REAL=cudafloattype, COMPLEX=cudacomplextype, N_updatecoeffsE=G.updatecoeffsE.size, N_updatecoeffsH=G.updatecoeffsH.size, NY_MATCOEFFS=G.updatecoeffsE.shape[1], NY_MATDISPCOEFFS=1, NX_FIELDS=G.nx + 1, NY_FIELDS=G.ny + 1, NZ_FIELDS=G.nz + 1, NX_ID=G.ID.shape[1], NY_ID=G.ID.shape[2], NZ_ID=G.ID.shape[3], NX_T=1, NY_T=1, NZ_T=1), options=compiler_opts)
-    update_e_gpu = kernels_fields.get_function("update_e")
-    update_h_gpu = kernels_fields.get_function("update_h")
+    # Kernels are prepared with their argument types so launches in the time
+    # loop (prepared_call) skip per-call argument type detection
+    update_e_gpu = kernels_fields.get_function("update_e").prepare("iiiPPPPPPP")
+    update_h_gpu = kernels_fields.get_function("update_h").prepare("iiiPPPPPPP")
 
     # Copy material coefficient arrays to constant memory of GPU (must be <64KB) for fields kernels
     updatecoeffsE = kernels_fields.get_global('updatecoeffsE')[0]
@@ -520,8 +547,8 @@ def solve_gpu(currentmodelrun, modelend, G):
 
     # Electric and magnetic field updates - dispersive materials - get kernel functions and initialise array on GPU
     if Material.maxpoles > 0:  # If there are any dispersive materials (updates are split into two parts as they require present and updated electric field values).
-        update_e_dispersive_A_gpu = kernels_fields.get_function("update_e_dispersive_A")
-        update_e_dispersive_B_gpu = kernels_fields.get_function("update_e_dispersive_B")
+        update_e_dispersive_A_gpu = kernels_fields.get_function("update_e_dispersive_A").prepare("iiiiPPPPPPPPPPP")
+        update_e_dispersive_B_gpu = kernels_fields.get_function("update_e_dispersive_B").prepare("iiiiPPPPPPPP")
         G.gpu_initialise_dispersive_arrays()
 
     # Electric and magnetic field updates - set blocks per grid and initialise field arrays on GPU
@@ -542,11 +569,11 @@ def solve_gpu(currentmodelrun, modelend, G):
         updatecoeffsH = kernels_pml_magnetic.get_global('updatecoeffsH')[0]
         drv.memcpy_htod(updatecoeffsE, G.updatecoeffsE)
         drv.memcpy_htod(updatecoeffsH, G.updatecoeffsH)
-        # Set block per grid, initialise arrays on GPU, and get kernel functions
+        # Initialise arrays on GPU, set block per grid, and get kernel functions
         for pml in G.pmls:
             pml.gpu_initialise_arrays()
-            pml.gpu_get_update_funcs(kernels_pml_electric, kernels_pml_magnetic)
             pml.gpu_set_blocks_per_grid(G)
+            pml.gpu_get_update_funcs(kernels_pml_electric, kernels_pml_magnetic, G)
 
     # Receivers
     if G.rxs:
@@ -554,7 +581,7 @@ def solve_gpu(currentmodelrun, modelend, G):
         rxcoords_gpu, rxs_gpu = gpu_initialise_rx_arrays(G)
         # Prepare kernel and get kernel function
         kernel_store_outputs = SourceModule(kernel_template_store_outputs.substitute(REAL=cudafloattype, NY_RXCOORDS=3, NX_RXS=6, NY_RXS=G.iterations, NZ_RXS=len(G.rxs), NX_FIELDS=G.nx + 1, NY_FIELDS=G.ny + 1, NZ_FIELDS=G.nz + 1), options=compiler_opts)
-        store_outputs_gpu = kernel_store_outputs.get_function("store_outputs")
+        store_outputs_gpu = kernel_store_outputs.get_function("store_outputs").prepare("iiPPPPPPPP")
 
     # Sources - initialise arrays on GPU, prepare kernel and get kernel functions
     if G.voltagesources + G.hertziandipoles + G.magneticdipoles:
@@ -564,15 +591,17 @@ def solve_gpu(currentmodelrun, modelend, G):
         updatecoeffsH = kernels_sources.get_global('updatecoeffsH')[0]
         drv.memcpy_htod(updatecoeffsE, G.updatecoeffsE)
         drv.memcpy_htod(updatecoeffsH, G.updatecoeffsH)
+        # Argument types of source kernels: 2 ints, 3 reals, and 7 pointers
+        srcargtypes = 'ii' + np.dtype(floattype).char * 3 + 'P' * 7
         if G.hertziandipoles:
             srcinfo1_hertzian_gpu, srcinfo2_hertzian_gpu, srcwaves_hertzian_gpu = gpu_initialise_src_arrays(G.hertziandipoles, G)
-            update_hertzian_dipole_gpu = kernels_sources.get_function("update_hertzian_dipole")
+            update_hertzian_dipole_gpu = kernels_sources.get_function("update_hertzian_dipole").prepare(srcargtypes)
         if G.magneticdipoles:
             srcinfo1_magnetic_gpu, srcinfo2_magnetic_gpu, srcwaves_magnetic_gpu = gpu_initialise_src_arrays(G.magneticdipoles, G)
-            update_magnetic_dipole_gpu = kernels_sources.get_function("update_magnetic_dipole")
+            update_magnetic_dipole_gpu = kernels_sources.get_function("update_magnetic_dipole").prepare(srcargtypes)
         if G.voltagesources:
             srcinfo1_voltage_gpu, srcinfo2_voltage_gpu, srcwaves_voltage_gpu = gpu_initialise_src_arrays(G.voltagesources, G)
-            update_voltage_source_gpu = kernels_sources.get_function("update_voltage_source")
+            update_voltage_source_gpu = kernels_sources.get_function("update_voltage_source").prepare(srcargtypes)
 
     # Snapshots - initialise arrays on GPU, prepare kernel and get kernel functions
     if G.snapshots:
@@ -580,7 +609,55 @@ def solve_gpu(currentmodelrun, modelend, G):
         snapEx_gpu, snapEy_gpu, snapEz_gpu, snapHx_gpu, snapHy_gpu, snapHz_gpu = gpu_initialise_snapshot_array(G)
         # Prepare kernel and get kernel function
         kernel_store_snapshot = SourceModule(kernel_template_store_snapshot.substitute(REAL=cudafloattype, NX_SNAPS=Snapshot.nx_max, NY_SNAPS=Snapshot.ny_max, NZ_SNAPS=Snapshot.nz_max, NX_FIELDS=G.nx + 1, NY_FIELDS=G.ny + 1, NZ_FIELDS=G.nz + 1), options=compiler_opts)
-        store_snapshot_gpu = kernel_store_snapshot.get_function("store_snapshot")
+        store_snapshot_gpu = kernel_store_snapshot.get_function("store_snapshot").prepare("i" * 10 + "P" * 12)
+        # Host arrays to copy snapshot data back into, allocated once in
+        # page-locked memory, if snapshots are transferred from GPU to host
+        # as they are stored
+        if G.snapsgpu2cpu:
+            snapEx_cpu = drv.pagelocked_empty(snapEx_gpu.shape, dtype=floattype)
+            snapEy_cpu = drv.pagelocked_empty(snapEy_gpu.shape, dtype=floattype)
+            snapEz_cpu = drv.pagelocked_empty(snapEz_gpu.shape, dtype=floattype)
+            snapHx_cpu = drv.pagelocked_empty(snapHx_gpu.shape, dtype=floattype)
+            snapHy_cpu = drv.pagelocked_empty(snapHy_gpu.shape, dtype=floattype)
+            snapHz_cpu = drv.pagelocked_empty(snapHz_gpu.shape, dtype=floattype)
+
+    # Magnetic and electric field updates - bind the (fixed) arguments of the
+    # prepared kernels, and select standard or dispersive electric field
+    # kernels once, so no branching is required in the time loop
+    update_h_fields_gpu = partial(update_h_gpu.prepared_call, G.bpg, G.tpb,
+                                  G.nx, G.ny, G.nz, G.ID_gpu.gpudata,
+                                  G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
+                                  G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata)
+    # If all materials are non-dispersive do standard update
+    if Material.maxpoles == 0:
+        update_e_fields_gpu = partial(update_e_gpu.prepared_call, G.bpg, G.tpb,
+                                      G.nx, G.ny, G.nz, G.ID_gpu.gpudata,
+                                      G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
+                                      G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata)
+        update_e_fields_dispersive_gpu = None
+    # If there are any dispersive materials do 1st part of dispersive update
+    # (it is split into two parts as it requires present and updated electric
+    # field values). The 2nd part can only be completely updated after the
+    # electric field has been updated by the PML and source updates.
+    else:
+        update_e_fields_gpu = partial(update_e_dispersive_A_gpu.prepared_call, G.bpg, G.tpb,
+                                      G.nx, G.ny, G.nz, Material.maxpoles, G.updatecoeffsdispersive_gpu.gpudata,
+                                      G.Tx_gpu.gpudata, G.Ty_gpu.gpudata, G.Tz_gpu.gpudata, G.ID_gpu.gpudata,
+                                      G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
+                                      G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata)
+        update_e_fields_dispersive_gpu = partial(update_e_dispersive_B_gpu.prepared_call, G.bpg, G.tpb,
+                                                 G.nx, G.ny, G.nz, Material.maxpoles, G.updatecoeffsdispersive_gpu.gpudata,
+                                                 G.Tx_gpu.gpudata, G.Ty_gpu.gpudata, G.Tz_gpu.gpudata, G.ID_gpu.gpudata,
+                                                 G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata)
+
+    # Iterations on which snapshots are stored, with index of each snapshot
+    snapsiterations = {}
+    for i, snap in enumerate(G.snapshots):
+        snapsiterations.setdefault(snap.time - 1, []).append((i, snap))
+
+    # PML update functions (with prepared kernel arguments bound)
+    pmlsupdatemagnetic_gpu = [pml.update_magnetic_gpu for pml in G.pmls]
+    pmlsupdateelectric_gpu = [pml.update_electric_gpu for pml in G.pmls]
 
     # Iteration loop timer
     iterstart = drv.Event()
@@ -589,111 +666,83 @@ def solve_gpu(currentmodelrun, modelend, G):
 
     for iteration in tqdm(range(G.iterations), desc='Running simulation, model ' + str(currentmodelrun) + '/' + str(modelend), ncols=get_terminal_width() - 1, file=sys.stdout, disable=not G.progressbars):
 
-        # Get GPU memory usage on final iteration
-        if iteration == G.iterations - 1:
-            memsolve = drv.mem_get_info()[1] - drv.mem_get_info()[0]
-
         # Store field component values for every receiver
         if G.rxs:
-            store_outputs_gpu(np.int32(len(G.rxs)), np.int32(iteration),
-                              rxcoords_gpu.gpudata, rxs_gpu.gpudata,
-                              G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
-                              G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
-                              block=(1, 1, 1), grid=(round32(len(G.rxs)), 1, 1))
+            store_outputs_gpu.prepared_call((round32(len(G.rxs)), 1, 1), (1, 1, 1),
+                                            len(G.rxs), iteration,
+                                            rxcoords_gpu.gpudata, rxs_gpu.gpudata,
+                                            G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
+                                            G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata)
 
         # Store any snapshots
-        for i, snap in enumerate(G.snapshots):
-            if snap.time == iteration + 1:
-                if not G.snapsgpu2cpu:
-                    store_snapshot_gpu(np.int32(i), np.int32(snap.xs),
-                                       np.int32(snap.xf), np.int32(snap.ys),
-                                       np.int32(snap.yf), np.int32(snap.zs),
-                                       np.int32(snap.zf), np.int32(snap.dx),
-                                       np.int32(snap.dy), np.int32(snap.dz),
-                                       G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
-                                       G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
-                                       snapEx_gpu.gpudata, snapEy_gpu.gpudata, snapEz_gpu.gpudata,
-                                       snapHx_gpu.gpudata, snapHy_gpu.gpudata, snapHz_gpu.gpudata,
-                                       block=Snapshot.tpb, grid=Snapshot.bpg)
-                else:
-                    store_snapshot_gpu(np.int32(0), np.int32(snap.xs),
-                                       np.int32(snap.xf), np.int32(snap.ys),
-                                       np.int32(snap.yf), np.int32(snap.zs),
-                                       np.int32(snap.zf), np.int32(snap.dx),
-                                       np.int32(snap.dy), np.int32(snap.dz),
-                                       G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
-                                       G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
-                                       snapEx_gpu.gpudata, snapEy_gpu.gpudata, snapEz_gpu.gpudata,
-                                       snapHx_gpu.gpudata, snapHy_gpu.gpudata, snapHz_gpu.gpudata,
-                                       block=Snapshot.tpb, grid=Snapshot.bpg)
-                    gpu_get_snapshot_array(snapEx_gpu.get(), snapEy_gpu.get(), snapEz_gpu.get(),
-                                           snapHx_gpu.get(), snapHy_gpu.get(), snapHz_gpu.get(), 0, snap)
+        for i, snap in snapsiterations.get(iteration, ()):
+            if not G.snapsgpu2cpu:
+                store_snapshot_gpu.prepared_call(Snapshot.bpg, Snapshot.tpb,
+                                                 i, snap.xs, snap.xf, snap.ys,
+                                                 snap.yf, snap.zs, snap.zf,
+                                                 snap.dx, snap.dy, snap.dz,
+                                                 G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
+                                                 G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
+                                                 snapEx_gpu.gpudata, snapEy_gpu.gpudata, snapEz_gpu.gpudata,
+                                                 snapHx_gpu.gpudata, snapHy_gpu.gpudata, snapHz_gpu.gpudata)
+            else:
+                store_snapshot_gpu.prepared_call(Snapshot.bpg, Snapshot.tpb,
+                                                 0, snap.xs, snap.xf, snap.ys,
+                                                 snap.yf, snap.zs, snap.zf,
+                                                 snap.dx, snap.dy, snap.dz,
+                                                 G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
+                                                 G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
+                                                 snapEx_gpu.gpudata, snapEy_gpu.gpudata, snapEz_gpu.gpudata,
+                                                 snapHx_gpu.gpudata, snapHy_gpu.gpudata, snapHz_gpu.gpudata)
+                gpu_get_snapshot_array(snapEx_gpu.get(ary=snapEx_cpu), snapEy_gpu.get(ary=snapEy_cpu), snapEz_gpu.get(ary=snapEz_cpu),
+                                       snapHx_gpu.get(ary=snapHx_cpu), snapHy_gpu.get(ary=snapHy_cpu), snapHz_gpu.get(ary=snapHz_cpu), 0, snap)
 
         # Update magnetic field components
-        update_h_gpu(np.int32(G.nx), np.int32(G.ny), np.int32(G.nz),
-                     G.ID_gpu.gpudata, G.Hx_gpu.gpudata, G.Hy_gpu.gpudata,
-                     G.Hz_gpu.gpudata, G.Ex_gpu.gpudata, G.Ey_gpu.gpudata,
-                     G.Ez_gpu.gpudata, block=G.tpb, grid=G.bpg)
+        update_h_fields_gpu()
 
         # Update magnetic field components with the PML correction
-        for pml in G.pmls:
-            pml.gpu_update_magnetic(G)
+        for update_pml_magnetic_gpu in pmlsupdatemagnetic_gpu:
+            update_pml_magnetic_gpu()
 
         # Update magnetic field components for magetic dipole sources
         if G.magneticdipoles:
-            update_magnetic_dipole_gpu(np.int32(len(G.magneticdipoles)), np.int32(iteration),
-                                       floattype(G.dx), floattype(G.dy), floattype(G.dz),
-                                       srcinfo1_magnetic_gpu.gpudata, srcinfo2_magnetic_gpu.gpudata,
-                                       srcwaves_magnetic_gpu.gpudata, G.ID_gpu.gpudata,
-                                       G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
-                                       block=(1, 1, 1), grid=(round32(len(G.magneticdipoles)), 1, 1))
-
-        # Update electric field components
-        # If all materials are non-dispersive do standard update
-        if Material.maxpoles == 0:
-            update_e_gpu(np.int32(G.nx), np.int32(G.ny), np.int32(G.nz), G.ID_gpu.gpudata,
-                         G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
-                         G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
-                         block=G.tpb, grid=G.bpg)
-        # If there are any dispersive materials do 1st part of dispersive update
-        # (it is split into two parts as it requires present and updated electric field values).
-        else:
-            update_e_dispersive_A_gpu(np.int32(G.nx), np.int32(G.ny), np.int32(G.nz),
-                                      np.int32(Material.maxpoles), G.updatecoeffsdispersive_gpu.gpudata,
-                                      G.Tx_gpu.gpudata, G.Ty_gpu.gpudata, G.Tz_gpu.gpudata, G.ID_gpu.gpudata,
-                                      G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
-                                      G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata,
-                                      block=G.tpb, grid=G.bpg)
+            update_magnetic_dipole_gpu.prepared_call((round32(len(G.magneticdipoles)), 1, 1), (1, 1, 1),
+                                                     len(G.magneticdipoles), iteration, G.dx, G.dy, G.dz,
+                                                     srcinfo1_magnetic_gpu.gpudata, srcinfo2_magnetic_gpu.gpudata,
+                                                     srcwaves_magnetic_gpu.gpudata, G.ID_gpu.gpudata,
+                                                     G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata)
+
+        # Update electric field components (standard or 1st part of dispersive)
+        update_e_fields_gpu()
 
         # Update electric field components with the PML correction
-        for pml in G.pmls:
-            pml.gpu_update_electric(G)
+        for update_pml_electric_gpu in pmlsupdateelectric_gpu:
+            update_pml_electric_gpu()
 
         # Update electric field components for voltage sources
         if G.voltagesources:
-            update_voltage_source_gpu(np.int32(len(G.voltagesources)), np.int32(iteration),
-                                      floattype(G.dx), floattype(G.dy), floattype(G.dz),
-                                      srcinfo1_voltage_gpu.gpudata, srcinfo2_voltage_gpu.gpudata,
-                                      srcwaves_voltage_gpu.gpudata, G.ID_gpu.gpudata,
-                                      G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
-                                      block=(1, 1, 1), grid=(round32(len(G.voltagesources)), 1, 1))
+            update_voltage_source_gpu.prepared_call((round32(len(G.voltagesources)), 1, 1), (1, 1, 1),
+                                                    len(G.voltagesources), iteration, G.dx, G.dy, G.dz,
+                                                    srcinfo1_voltage_gpu.gpudata, srcinfo2_voltage_gpu.gpudata,
+                                                    srcwaves_voltage_gpu.gpudata, G.ID_gpu.gpudata,
+                                                    G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata)
 
         # Update electric field components for Hertzian dipole sources (update any Hertzian dipole sources last)
         if G.hertziandipoles:
-            update_hertzian_dipole_gpu(np.int32(len(G.hertziandipoles)), np.int32(iteration),
-                                       floattype(G.dx), floattype(G.dy), floattype(G.dz),
-                                       srcinfo1_hertzian_gpu.gpudata, srcinfo2_hertzian_gpu.gpudata,
-                                       srcwaves_hertzian_gpu.gpudata, G.ID_gpu.gpudata,
-                                       G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
-                                       block=(1, 1, 1), grid=(round32(len(G.hertziandipoles)), 1, 1))
-
-        # If there are any dispersive materials do 2nd part of dispersive update (it is split into two parts as it requires present and updated electric field values). Therefore it can only be completely updated after the electric field has been updated by the PML and source updates.
-        if Material.maxpoles > 0:
-            update_e_dispersive_B_gpu(np.int32(G.nx), np.int32(G.ny), np.int32(G.nz),
-                                      np.int32(Material.maxpoles), G.updatecoeffsdispersive_gpu.gpudata,
-                                      G.Tx_gpu.gpudata, G.Ty_gpu.gpudata, G.Tz_gpu.gpudata, G.ID_gpu.gpudata,
-                                      G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata,
-                                      block=G.tpb, grid=G.bpg)
+            update_hertzian_dipole_gpu.prepared_call((round32(len(G.hertziandipoles)), 1, 1), (1, 1, 1),
+                                                     len(G.hertziandipoles), iteration, G.dx, G.dy, G.dz,
+                                                     srcinfo1_hertzian_gpu.gpudata, srcinfo2_hertzian_gpu.gpudata,
+                                                     srcwaves_hertzian_gpu.gpudata, G.ID_gpu.gpudata,
+                                                     G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata)
+
+        # If there are any dispersive materials do 2nd part of dispersive update
+        if update_e_fields_dispersive_gpu:
+            update_e_fields_dispersive_gpu()
+
+    # Get GPU memory usage (no device allocations are made during the time
+    # loop so this is the same as on the final iteration)
+    free, total = drv.mem_get_info()
+    memsolve = total - free
 
     # Copy output from receivers array back to correct receiver objects
     if G.rxs:
@@ -701,9 +750,15 @@ def solve_gpu(currentmodelrun, modelend, G):
 
     # Copy data from any snapshots back to correct snapshot objects
     if G.snapshots and not G.snapsgpu2cpu:
+        snapEx_cpu = snapEx_gpu.get()
+        snapEy_cpu = snapEy_gpu.get()
+        snapEz_cpu = snapEz_gpu.get()
+        snapHx_cpu = snapHx_gpu.get()
+        snapHy_cpu = snapHy_gpu.get()
+        snapHz_cpu = snapHz_gpu.get()
         for i, snap in enumerate(G.snapshots):
-            gpu_get_snapshot_array(snapEx_gpu.get(), snapEy_gpu.get(), snapEz_gpu.get(),
-                                   snapHx_gpu.get(), snapHy_gpu.get(), snapHz_gpu.get(), i, snap)
+            gpu_get_snapshot_array(snapEx_cpu, snapEy_cpu, snapEz_cpu,
+                                   snapHx_cpu, snapHy_cpu, snapHz_cpu, i, snap)
 
     iterend.record()
     iterend.synchronize()
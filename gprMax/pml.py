@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
 
+from functools import partial
 from importlib import import_module
 
 import numpy as np
@@ -273,36 +274,33 @@ class PML(object):
                 self.HRE[x, :] = ((2 * e0) - G.dt * Halpha) / tmp
                 self.HRF[x, :] = (2 * Hsigma * G.dt) / tmp
 
-    def update_electric(self, G):
-        """This functions updates electric field components with the PML correction.
+    def get_update_funcs(self, G):
+        """Get update functions for the PML formulation, order, and direction.
 
         Args:
             G (class): Grid class instance - holds essential parameters describing the model.
         """
 
-        pmlmodule = 'gprMax.pml_updates.pml_updates_electric_' + G.pmlformulation + '_ext'
-        func = getattr(import_module(pmlmodule), 'order' + str(len(self.CFS)) + '_' + self.direction)
-        func(self.xs, self.xf, self.ys, self.yf, self.zs, self.zf, G.nthreads, G.updatecoeffsE, G.ID, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz, self.EPhi1, self.EPhi2, self.ERA, self.ERB, self.ERE, self.ERF, self.d)
+        pmlmodulelectric = 'gprMax.pml_updates.pml_updates_electric_' + G.pmlformulation + '_ext'
+        pmlmodulemagnetic = 'gprMax.pml_updates.pml_updates_magnetic_' + G.pmlformulation + '_ext'
+        funcname = 'order' + str(len(self.CFS)) + '_' + self.direction
 
-    def update_magnetic(self, G):
-        """This functions updates magnetic field components with the PML correction.
-
-        Args:
-            G (class): Grid class instance - holds essential parameters describing the model.
-        """
-
-        pmlmodule = 'gprMax.pml_updates.pml_updates_magnetic_' + G.pmlformulation + '_ext'
-        func = getattr(import_module(pmlmodule), 'order' + str(len(self.CFS)) + '_' + self.direction)
-        func(self.xs, self.xf, self.ys, self.yf, self.zs, self.zf, G.nthreads, G.updatecoeffsH, G.ID, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz, self.HPhi1, self.HPhi2, self.HRA, self.HRB, self.HRE, self.HRF, self.d)
+        # Bind arguments that are constant for the run so each update is a single call
+        self.update_electric_func = partial(getattr(import_module(pmlmodulelectric), funcname), self.xs, self.xf, self.ys, self.yf, self.zs, self.zf, G.nthreads, G.updatecoeffsE, G.ID, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz, self.EPhi1, self.EPhi2, self.ERA, self.ERB, self.ERE, self.ERF, self.d)
+        self.update_magnetic_func = partial(getattr(import_module(pmlmodulemagnetic), funcname), self.xs, self.xf, self.ys, self.yf, self.zs, self.zf, G.nthreads, G.updatecoeffsH, G.ID, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz, self.HPhi1, self.HPhi2, self.HRA, self.HRB, self.HRE, self.HRF, self.d)
 
     def gpu_set_blocks_per_grid(self, G):
         """Set the blocks per grid size used for updating the PML field arrays on a GPU.
+            Threads are only mapped to the first CFS term of the Phi arrays,
+            so the grid for each of the electric and magnetic updates only
+            needs to cover the larger of the two Phi arrays it uses.
 
         Args:
             G (class): Grid class instance - holds essential parameters describing the model.
         """
 
-        self.bpg = (int(np.ceil(((self.EPhi1_gpu.shape[1] + 1) * (self.EPhi1_gpu.shape[2] + 1) * (self.EPhi1_gpu.shape[3] + 1)) / G.tpb[0])), 1, 1)
+        self.bpg_electric = (int(np.ceil(max(np.prod(self.EPhi1_gpu.shape[1:]), np.prod(self.EPhi2_gpu.shape[1:])) / G.tpb[0])), 1, 1)
+        self.bpg_magnetic = (int(np.ceil(max(np.prod(self.HPhi1_gpu.shape[1:]), np.prod(self.HPhi2_gpu.shape[1:])) / G.tpb[0])), 1, 1)
 
     def gpu_initialise_arrays(self):
         """Initialise PML field and coefficient arrays on GPU."""
@@ -334,34 +332,23 @@ class PML(object):
             self.HPhi1_gpu = gpuarray.to_gpu(np.zeros((len(self.CFS), self.nx + 1, self.ny, self.nz), dtype=floattype))
             self.HPhi2_gpu = gpuarray.to_gpu(np.zeros((len(self.CFS), self.nx, self.ny + 1, self.nz), dtype=floattype))
 
-    def gpu_get_update_funcs(self, kernelselectric, kernelsmagnetic):
-        """Get update functions from PML kernels.
+    def gpu_get_update_funcs(self, kernelselectric, kernelsmagnetic, G):
+        """Get update functions from PML kernels, and bind their arguments
+            (which are fixed for the model) to prepared kernel calls.
 
         Args:
             kernelselectric: PyCuda SourceModule containing PML kernels for electric updates.
             kernelsmagnetic: PyCuda SourceModule containing PML kernels for magnetic updates.
-        """
-
-        self.update_electric_gpu = kernelselectric.get_function('order' + str(len(self.CFS)) + '_' + self.direction)
-        self.update_magnetic_gpu = kernelsmagnetic.get_function('order' + str(len(self.CFS)) + '_' + self.direction)
-
-    def gpu_update_electric(self, G):
-        """This functions updates electric field components with the PML correction on the GPU.
-
-        Args:
             G (class): Grid class instance - holds essential parameters describing the model.
         """
 
-        self.update_electric_gpu(np.int32(self.xs), np.int32(self.xf), np.int32(self.ys), np.int32(self.yf), np.int32(self.zs), np.int32(self.zf), np.int32(self.EPhi1_gpu.shape[1]), np.int32(self.EPhi1_gpu.shape[2]), np.int32(self.EPhi1_gpu.shape[3]), np.int32(self.EPhi2_gpu.shape[1]), np.int32(self.EPhi2_gpu.shape[2]), np.int32(self.EPhi2_gpu.shape[3]), np.int32(self.thickness), G.ID_gpu.gpudata, G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata, G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata, self.EPhi1_gpu.gpudata, self.EPhi2_gpu.gpudata, self.ERA_gpu.gpudata, self.ERB_gpu.gpudata, self.ERE_gpu.gpudata, self.ERF_gpu.gpudata, floattype(self.d), block=G.tpb, grid=self.bpg)
-
-    def gpu_update_magnetic(self, G):
-        """This functions updates magnetic field components with the PML correction on the GPU.
-
-        Args:
-            G (class): Grid class instance - holds essential parameters describing the model.
-        """
+        # Argument types: 13 ints, 13 pointers, and the PML coefficient d
+        argtypes = 'i' * 13 + 'P' * 13 + np.dtype(floattype).char
+        update_electric_gpu = kernelselectric.get_function('order' + str(len(self.CFS)) + '_' + self.direction).prepare(argtypes)
+        update_magnetic_gpu = kernelsmagnetic.get_function('order' + str(len(self.CFS)) + '_' + self.direction).prepare(argtypes)
 
-        self.update_magnetic_gpu(np.int32(self.xs), np.int32(self.xf), np.int32(self.ys), np.int32(self.yf), np.int32(self.zs), np.int32(self.zf), np.int32(self.HPhi1_gpu.shape[1]), np.int32(self.HPhi1_gpu.shape[2]), np.int32(self.HPhi1_gpu.shape[3]), np.int32(self.HPhi2_gpu.shape[1]), np.int32(self.HPhi2_gpu.shape[2]), np.int32(self.HPhi2_gpu.shape[3]), np.int32(self.thickness), G.ID_gpu.gpudata, G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata, G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata, self.HPhi1_gpu.gpudata, self.HPhi2_gpu.gpudata, self.HRA_gpu.gpudata, self.HRB_gpu.gpudata, self.HRE_gpu.gpudata, self.HRF_gpu.gpudata, floattype(self.d), block=G.tpb, grid=self.bpg)
+        self.update_electric_gpu = partial(update_electric_gpu.prepared_call, self.bpg_electric, G.tpb, self.xs, self.xf, self.ys, self.yf, self.zs, self.zf, self.EPhi1_gpu.shape[1], self.EPhi1_gpu.shape[2], self.EPhi1_gpu.shape[3], self.EPhi2_gpu.shape[1], self.EPhi2_gpu.shape[2], self.EPhi2_gpu.shape[3], self.thickness, G.ID_gpu.gpudata, G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata, G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata, self.EPhi1_gpu.gpudata, self.EPhi2_gpu.gpudata, self.ERA_gpu.gpudata, self.ERB_gpu.gpudata, self.ERE_gpu.gpudata, self.ERF_gpu.gpudata, self.d)
+        self.update_magnetic_gpu = partial(update_magnetic_gpu.prepared_call, self.bpg_magnetic, G.tpb, self.xs, self.xf, self.ys, self.yf, self.zs, self.zf, self.HPhi1_gpu.shape[1], self.HPhi1_gpu.shape[2], self.HPhi1_gpu.shape[3], self.HPhi2_gpu.shape[1], self.HPhi2_gpu.shape[2], self.HPhi2_gpu.shape[3], self.thickness, G.ID_gpu.gpudata, G.Ex_gpu.gpudata, G.Ey_gpu.gpudata, G.Ez_gpu.gpudata, G.Hx_gpu.gpudata, G.Hy_gpu.gpudata, G.Hz_gpu.gpudata, self.HPhi1_gpu.gpudata, self.HPhi2_gpu.gpudata, self.HRA_gpu.gpudata, self.HRB_gpu.gpudata, self.HRE_gpu.gpudata, self.HRF_gpu.gpudata, self.d)
 
 
 def build_pmls(G, pbar):
@@ -375,6 +362,9 @@ def build_pmls(G, pbar):
         pbar (class): Progress bar class instance.
     """
 
+    # Materials keyed by numeric ID for lookup of the material of each cell
+    materials = {material.numID: material for material in G.materials}
+
     for key, value in G.pmlthickness.items():
         if value > 0:
             sumer = 0  # Sum of relative permittivities in PML slab
@@ -389,7 +379,7 @@ def build_pmls(G, pbar):
                 for j in range(G.ny):
                     for k in range(G.nz):
                         numID = G.solid[pml.xs, j, k]
-                        material = next(x for x in G.materials if x.numID == numID)
+                        material = materials[numID]
                         sumer += material.er
                         summr += material.mr
                 averageer = sumer / (G.ny * G.nz)
@@ -404,7 +394,7 @@ def build_pmls(G, pbar):
                 for i in range(G.nx):
                     for k in range(G.nz):
                         numID = G.solid[i, pml.ys, k]
-                        material = next(x for x in G.materials if x.numID == numID)
+                        material = materials[numID]
                         sumer += material.er
                         summr += material.mr
                 averageer = sumer / (G.nx * G.nz)
@@ -419,7 +409,7 @@ def build_pmls(G, pbar):
                 for i in range(G.nx):
                     for j in range(G.ny):
                         numID = G.solid[i, j, pml.zs]
-                        material = next(x for x in G.materials if x.numID == numID)
+                        material = materials[numID]
                         sumer += material.er
                         summr += material.mr
                 averageer = sumer / (G.nx * G.ny)
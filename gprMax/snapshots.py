@@ -191,22 +191,16 @@ def gpu_initialise_snapshot_array(G):
     # GPU - blocks per grid - according to largest requested snapshot
     Snapshot.bpg = (int(np.ceil(((Snapshot.nx_max) * (Snapshot.ny_max) * (Snapshot.nz_max)) / Snapshot.tpb[0])), 1, 1)
 
-    # 4D arrays to store snapshots on GPU, e.g. snapEx(time, x, y, z)
+    # 4D arrays to store snapshots on GPU, e.g. snapEx(time, x, y, z) -
+    # allocated and zeroed directly on GPU, i.e. without host arrays/copies
     numsnaps = 1 if G.snapsgpu2cpu else len(G.snapshots)
-    snapEx = np.zeros((numsnaps, Snapshot.nx_max, Snapshot.ny_max, Snapshot.nz_max), dtype=floattype)
-    snapEy = np.zeros((numsnaps, Snapshot.nx_max, Snapshot.ny_max, Snapshot.nz_max), dtype=floattype)
-    snapEz = np.zeros((numsnaps, Snapshot.nx_max, Snapshot.ny_max, Snapshot.nz_max), dtype=floattype)
-    snapHx = np.zeros((numsnaps, Snapshot.nx_max, Snapshot.ny_max, Snapshot.nz_max), dtype=floattype)
-    snapHy = np.zeros((numsnaps, Snapshot.nx_max, Snapshot.ny_max, Snapshot.nz_max), dtype=floattype)
-    snapHz = np.zeros((numsnaps, Snapshot.nx_max, Snapshot.ny_max, Snapshot.nz_max), dtype=floattype)
-
-    # Copy arrays to GPU
-    snapEx_gpu = gpuarray.to_gpu(snapEx)
-    snapEy_gpu = gpuarray.to_gpu(snapEy)
-    snapEz_gpu = gpuarray.to_gpu(snapEz)
-    snapHx_gpu = gpuarray.to_gpu(snapHx)
-    snapHy_gpu = gpuarray.to_gpu(snapHy)
-    snapHz_gpu = gpuarray.to_gpu(snapHz)
+    shape = (numsnaps, Snapshot.nx_max, Snapshot.ny_max, Snapshot.nz_max)
+    snapEx_gpu = gpuarray.zeros(shape, dtype=floattype)
+    snapEy_gpu = gpuarray.zeros(shape, dtype=floattype)
+    snapEz_gpu = gpuarray.zeros(shape, dtype=floattype)
+    snapHx_gpu = gpuarray.zeros(shape, dtype=floattype)
+    snapHy_gpu = gpuarray.zeros(shape, dtype=floattype)
+    snapHz_gpu = gpuarray.zeros(shape, dtype=floattype)
 
     return snapEx_gpu, snapEy_gpu, snapEz_gpu, snapHx_gpu, snapHy_gpu, snapHz_gpu
 
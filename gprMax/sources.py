@@ -89,15 +89,16 @@ class VoltageSource(Source):
             G (class): Grid class instance - holds essential parameters describing the model.
         """
 
-        if iteration * G.dt >= self.start and iteration * G.dt <= self.stop:
+        time = iteration * G.dt
+        if time >= self.start and time <= self.stop:
             i = self.xcoord
             j = self.ycoord
             k = self.zcoord
-            componentID = 'E' + self.polarisation
+            componentnum = G.IDlookup['E' + self.polarisation]
 
             if self.polarisation == 'x':
                 if self.resistance != 0:
-                    Ex[i, j, k] -= (updatecoeffsE[ID[G.IDlookup[componentID], i, j, k], 4] 
+                    Ex[i, j, k] -= (updatecoeffsE[ID[componentnum, i, j, k], 4] 
                                     * self.waveformvalues_wholestep[iteration] 
                                     * (1 / (self.resistance * G.dy * G.dz)))
                 else:
@@ -105,7 +106,7 @@ class VoltageSource(Source):
 
             elif self.polarisation == 'y':
                 if self.resistance != 0:
-                    Ey[i, j, k] -= (updatecoeffsE[ID[G.IDlookup[componentID], i, j, k], 4] 
+                    Ey[i, j, k] -= (updatecoeffsE[ID[componentnum, i, j, k], 4] 
                                     * self.waveformvalues_wholestep[iteration] 
                                     * (1 / (self.resistance * G.dx * G.dz)))
                 else:
@@ -113,7 +114,7 @@ class VoltageSource(Source):
 
             elif self.polarisation == 'z':
                 if self.resistance != 0:
-                    Ez[i, j, k] -= (updatecoeffsE[ID[G.IDlookup[componentID], i, j, k], 4] 
+                    Ez[i, j, k] -= (updatecoeffsE[ID[componentnum, i, j, k], 4] 
                                     * self.waveformvalues_wholestep[iteration] 
                                     * (1 / (self.resistance * G.dx * G.dy)))
                 else:
@@ -171,24 +172,25 @@ class HertzianDipole(Source):
             G (class): Grid class instance - holds essential parameters describing the model.
         """
 
-        if iteration * G.dt >= self.start and iteration * G.dt <= self.stop:
+        time = iteration * G.dt
+        if time >= self.start and time <= self.stop:
             i = self.xcoord
             j = self.ycoord
             k = self.zcoord
-            componentID = 'E' + self.polarisation
+            componentnum = G.IDlookup['E' + self.polarisation]
 
             if self.polarisation == 'x':
-                Ex[i, j, k] -= (updatecoeffsE[ID[G.IDlookup[componentID], i, j, k], 4] 
+                Ex[i, j, k] -= (updatecoeffsE[ID[componentnum, i, j, k], 4] 
                                 * self.waveformvalues_wholestep[iteration] 
                                 * self.dl * (1 / (G.dx * G.dy * G.dz)))
 
             elif self.polarisation == 'y':
-                Ey[i, j, k] -= (updatecoeffsE[ID[G.IDlookup[componentID], i, j, k], 4] 
+                Ey[i, j, k] -= (updatecoeffsE[ID[componentnum, i, j, k], 4] 
                                 * self.waveformvalues_wholestep[iteration] 
                                 * self.dl * (1 / (G.dx * G.dy * G.dz)))
 
             elif self.polarisation == 'z':
-                Ez[i, j, k] -= (updatecoeffsE[ID[G.IDlookup[componentID], i, j, k], 4] 
+                Ez[i, j, k] -= (updatecoeffsE[ID[componentnum, i, j, k], 4] 
                                 * self.waveformvalues_wholestep[iteration] 
                                 * self.dl * (1 / (G.dx * G.dy * G.dz)))
 
@@ -210,24 +212,25 @@ class MagneticDipole(Source):
             G (class): Grid class instance - holds essential parameters describing the model.
         """
 
-        if iteration * G.dt >= self.start and iteration * G.dt <= self.stop:
+        time = iteration * G.dt
+        if time >= self.start and time <= self.stop:
             i = self.xcoord
             j = self.ycoord
             k = self.zcoord
-            componentID = 'H' + self.polarisation
+            componentnum = G.IDlookup['H' + self.polarisation]
 
             if self.polarisation == 'x':
-                Hx[i, j, k] -= (updatecoeffsH[ID[G.IDlookup[componentID], i, j, k], 4] 
+                Hx[i, j, k] -= (updatecoeffsH[ID[componentnum, i, j, k], 4] 
                                 * self.waveformvalues_halfstep[iteration] 
                                 * (1 / (G.dx * G.dy * G.dz)))
 
             elif self.polarisation == 'y':
-                Hy[i, j, k] -= (updatecoeffsH[ID[G.IDlookup[componentID], i, j, k], 4] 
+                Hy[i, j, k] -= (updatecoeffsH[ID[componentnum, i, j, k], 4] 
                                 * self.waveformvalues_halfstep[iteration] 
                                 * (1 / (G.dx * G.dy * G.dz)))
 
             elif self.polarisation == 'z':
-                Hz[i, j, k] -= (updatecoeffsH[ID[G.IDlookup[componentID], i, j, k], 4] 
+                Hz[i, j, k] -= (updatecoeffsH[ID[componentnum, i, j, k], 4] 
                                 * self.waveformvalues_halfstep[iteration] 
                                 * (1 / (G.dx * G.dy * G.dz)))
 
@@ -408,7 +411,8 @@ class TransmissionLine(Source):
             G (class): Grid class instance - holds essential parameters describing the model.
         """
 
-        if iteration * G.dt >= self.start and iteration * G.dt <= self.stop:
+        time = iteration * G.dt
+        if time >= self.start and time <= self.stop:
             i = self.xcoord
             j = self.ycoord
             k = self.zcoord
@@ -435,7 +439,8 @@ class TransmissionLine(Source):
             G (class): Grid class instance - holds essential parameters describing the model.
         """
 
-        if iteration * G.dt >= self.start and iteration * G.dt <= self.stop:
+        time = iteration * G.dt
+        if time >= self.start and time <= self.stop:
             i = self.xcoord
             j = self.ycoord
             k = self.zcoord
@@ -0,0 +1,71 @@
+import unittest
+
+from gprMax.exceptions import CmdInputError
+from gprMax.grid import FDTDGrid
+from gprMax.input_cmds_file import check_cmd_names
+from gprMax.input_cmds_geometry import process_geometrycmds
+from gprMax.input_cmds_multiuse import process_multicmds
+from gprMax.input_cmds_singleuse import process_singlecmds
+from gprMax.materials import Material
+from gprMax.utilities import get_host_info
+
+# Valid rough surface on the zplus face of the fractal box
+rough = '#add_surface_roughness: 0 0 0.040 0.050 0.050 0.040 1.5 1 1 0.035 0.045 fb1'
+
+
+class My_input_cmds_geometry_test(unittest.TestCase):
+    def build_geometry(self, cmds):
+        """helper function"""
+        G = FDTDGrid()
+        G.messages = False
+        G.progressbars = False
+        G.hostinfo = get_host_info()
+        G.materials.append(Material(0, 'pec'))
+        G.materials.append(Material(1, 'free_space'))
+        lines = ['#domain: 0.05 0.05 0.05',
+                 '#dx_dy_dz: 0.002 0.002 0.002',
+                 '#time_window: 3e-9',
+                 '#material: 5 0 1 0 soil',
+                 '#fractal_box: 0 0 0 0.05 0.05 0.04 1.5 1 1 1 1 soil fb1'] + cmds
+        singlecmds, multicmds, geometry = check_cmd_names(lines)
+        process_singlecmds(singlecmds, G)
+        process_multicmds(multicmds, G)
+        G.initialise_geometry_arrays()
+        process_geometrycmds(geometry, G)
+
+    def test_add_surface_water_too_many_parameters(self):
+        # Trailing fractal box ID must not let a malformed modifier be skipped
+        with self.assertRaisesRegex(CmdInputError, 'requires exactly eight parameters'):
+            self.build_geometry([rough, '#add_surface_water: 0 0 0.040 0.050 0.050 0.040 0.040 0.5 fb1'])
+
+    def test_add_surface_roughness_too_many_parameters(self):
+        with self.assertRaisesRegex(CmdInputError, 'too many parameters have been given'):
+            self.build_geometry(['#add_surface_roughness: 0 0 0 0.050 0.050 0 1.5 1 1 0 0.005 fb1 1 fb1'])
+
+    def test_add_grass_too_few_parameters(self):
+        with self.assertRaisesRegex(CmdInputError, 'requires at least eleven parameters'):
+            self.build_geometry([rough, '#add_grass: 0 0 0.040 0.050 0.050 0.040 1.5 0.040 0.045 10'])
+
+    def test_add_surface_roughness_zminus_exceeds_fractal_box(self):
+        with self.assertRaisesRegex(CmdInputError, 'upper coordinates of the fractal box or the domain in the z direction'):
+            self.build_geometry(['#add_surface_roughness: 0 0 0 0.050 0.050 0 1.5 1 1 0 0.046 fb1'])
+
+    def test_add_surface_roughness_zplus_exceeds_domain(self):
+        with self.assertRaisesRegex(CmdInputError, 'lower coordinates of the fractal box or the domain in the z direction'):
+            self.build_geometry(['#add_surface_roughness: 0 0 0.040 0.050 0.050 0.040 1.5 1 1 0.036 0.060 fb1'])
+
+    def test_add_surface_roughness_not_planar(self):
+        with self.assertRaisesRegex(CmdInputError, 'dimensions are not specified correctly'):
+            self.build_geometry(['#add_surface_roughness: 0 0 0.010 0.050 0.050 0.040 1.5 1 1 0.035 0.045 fb1'])
+
+    def test_add_surface_roughness_planar_in_two_directions(self):
+        with self.assertRaisesRegex(CmdInputError, 'dimensions are not specified correctly'):
+            self.build_geometry(['#add_surface_roughness: 0 0 0.040 0.050 0 0.040 1.5 1 1 0.035 0.045 fb1'])
+
+    def test_add_surface_roughness_not_on_external_surface(self):
+        with self.assertRaisesRegex(CmdInputError, 'can only be used on the external surfaces of a fractal box'):
+            self.build_geometry(['#add_surface_roughness: 0 0 0.020 0.050 0.050 0.020 1.5 1 1 0.015 0.025 fb1'])
+
+
+if __name__ == '__main__':
+    unittest.main()